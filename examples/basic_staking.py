@@ -1,9 +1,17 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 import example_utils
 
 from hyperliquid.utils import constants
 
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
 # Set to True to use Ledger hardware wallet for signing
 USE_LEDGER = True
 LEDGER_ACCOUNT_PATH = "44'/60'/27'/0/0"  # Default Ethereum derivation path
@@ -12,6 +20,12 @@ LEDGER_ACCOUNT_PATH = "44'/60'/27'/0/0"  # Default Ethereum derivation path
 USE_TESTNET = True
 
 
+def dumps(obj):
+    if _HAS_ORJSON:
+        return str(orjson.dumps(obj, option=orjson.OPT_INDENT_2), "utf-8")
+    return json.dumps(obj, indent=2)
+
+
 def main():
     base_url = constants.TESTNET_API_URL if USE_TESTNET else constants.MAINNET_API_URL
     address, info, exchange = example_utils.setup(
@@ -21,20 +35,26 @@ def main():
         ledger_account_path=LEDGER_ACCOUNT_PATH,
     )
 
+    # The three staking queries are independent, so issue them concurrently
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        summary_future = executor.submit(info.user_staking_summary, address)
+        delegations_future = executor.submit(info.user_staking_delegations, address)
+        rewards_future = executor.submit(info.user_staking_rewards, address, limit=5)
+
     # Get the user staking summary and print information
-    user_staking_summary = info.user_staking_summary(address)
+    user_staking_summary = summary_future.result()
     print("Staking summary:")
-    print(json.dumps(user_staking_summary, indent=2))
+    print(dumps(user_staking_summary))
 
     # Get the user staking delegations and print information
-    user_delegations = info.user_staking_delegations(address)
+    user_delegations = delegations_future.result()
     print("Staking breakdown:")
-    print(json.dumps(user_delegations, indent=2))
+    print(dumps(user_delegations))
 
     # Get the user staking reward history and print information
-    user_staking_rewards = info.user_staking_rewards(address)
+    user_staking_rewards = rewards_future.result()
     print("Most recent staking rewards:")
-    print(json.dumps(user_staking_rewards[:5], indent=2))
+    print(dumps(user_staking_rewards))
 
 
 if __name__ == "__main__":
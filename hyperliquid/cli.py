@@ -45,13 +45,43 @@ Examples:
     python -m hyperliquid.cli cDeposit --wei 100000000 --ledger-account 0 --testnet
 """
 
-import argparse
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
 import json
 import sys
 
-from hyperliquid.exchange import Exchange
-from hyperliquid.utils.constants import MAINNET_API_URL, TESTNET_API_URL
-from hyperliquid.utils.ledger_signer import LedgerSigner
+try:
+    import orjson
+
+    _HAS_ORJSON = True
+except ImportError:
+    _HAS_ORJSON = False
+
+# orjson is used when installed; it parses and pretty-prints much faster than the stdlib
+_loads: Callable[[str], Any]
+if _HAS_ORJSON:
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        return str(orjson.dumps(obj, option=orjson.OPT_INDENT_2), "utf-8")
+
+else:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> str:
+        return json.dumps(obj, indent=2)
+
+
+def _print_json(obj: Any) -> None:
+    """Pretty-print obj to stdout, writing orjson's bytes straight to the binary buffer when possible."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if not _HAS_ORJSON or buffer is None:
+        print(_dumps(obj))
+        return
+    sys.stdout.flush()
+    buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+    buffer.flush()
 
 
 def get_ledger_account_path(account_index: int) -> str:
@@ -59,75 +89,217 @@ def get_ledger_account_path(account_index: int) -> str:
     return f"44'/60'/{account_index}'/0/0"
 
 
-def normalize_validator_register_params(params: dict) -> dict:
+def _base_url(testnet: bool) -> str:
+    """Return the API URL for the selected network."""
+    from hyperliquid.utils.constants import MAINNET_API_URL, TESTNET_API_URL
+
+    return TESTNET_API_URL if testnet else MAINNET_API_URL
+
+
+class ValidatorRegisterParams(NamedTuple):
+    """Keyword arguments for Exchange.c_validator_register."""
+
+    # The nested API format does not require these, so they are None when it leaves them out
+    node_ip: Optional[str]
+    name: Optional[str]
+    description: Optional[str]
+    delegations_disabled: bool
+    commission_bps: int
+    signer: Optional[str]
+    unjailed: bool
+    initial_wei: Optional[int]
+
+
+class ValidatorChangeProfileParams(NamedTuple):
+    """Keyword arguments for Exchange.c_validator_change_profile."""
+
+    node_ip: Optional[str]
+    name: Optional[str]
+    description: Optional[str]
+    unjailed: bool
+    disable_delegations: Optional[bool]
+    commission_bps: Optional[int]
+    signer: Optional[str]
+
+
+def _unwrap_ip(node_ip: Any) -> Any:
+    """Extract node_ip from the API's {"Ip": "..."} format if present."""
+    if isinstance(node_ip, dict) and "Ip" in node_ip:
+        return node_ip["Ip"]
+    return node_ip
+
+
+def _expect_object(value: Any, name: str) -> Dict[str, Any]:
+    """Return value if it is a JSON object, otherwise raise ValueError."""
+    if not isinstance(value, dict):
+        raise ValueError(f"{name} must be a JSON object")
+    return value
+
+
+def normalize_validator_register_params(params: Dict[str, Any]) -> ValidatorRegisterParams:
     """
     Normalize cValidatorRegister params to flat format.
     Supports both flat format and nested API format.
+    Raises KeyError if a required field of the flat format is missing,
+    and ValueError if the params or a nested section are not JSON objects.
     """
+    _expect_object(params, "--json")
     # Check if it's the nested API format
     if "register" in params:
-        reg = params["register"]
-        profile = reg.get("profile", {})
-        # Extract node_ip from {"Ip": "..."} format if present
-        node_ip = profile.get("node_ip")
-        if isinstance(node_ip, dict) and "Ip" in node_ip:
-            node_ip = node_ip["Ip"]
-        return {
-            "node_ip": node_ip,
-            "name": profile.get("name"),
-            "description": profile.get("description"),
-            "delegations_disabled": profile.get("delegations_disabled", False),
-            "commission_bps": profile.get("commission_bps", 0),
-            "signer": profile.get("signer"),
-            "unjailed": reg.get("unjailed", True),
-            "initial_wei": reg.get("initial_wei"),
-        }
-    # Already flat format, but handle node_ip if it's {"Ip": "..."} format
-    if isinstance(params.get("node_ip"), dict) and "Ip" in params["node_ip"]:
-        params = params.copy()
-        params["node_ip"] = params["node_ip"]["Ip"]
-    return params
-
-
-def normalize_validator_change_profile_params(params: dict) -> dict:
+        reg = _expect_object(params["register"], "register")
+        profile = _expect_object(reg.get("profile", {}), "register.profile")
+        return ValidatorRegisterParams(
+            node_ip=_unwrap_ip(profile.get("node_ip")),
+            name=profile.get("name"),
+            description=profile.get("description"),
+            delegations_disabled=profile.get("delegations_disabled", False),
+            commission_bps=profile.get("commission_bps", 0),
+            signer=profile.get("signer"),
+            unjailed=reg.get("unjailed", True),
+            initial_wei=reg.get("initial_wei"),
+        )
+    return ValidatorRegisterParams(
+        node_ip=_unwrap_ip(params["node_ip"]),
+        name=params["name"],
+        description=params["description"],
+        delegations_disabled=params["delegations_disabled"],
+        commission_bps=params["commission_bps"],
+        signer=params["signer"],
+        unjailed=params["unjailed"],
+        initial_wei=params["initial_wei"],
+    )
+
+
+def normalize_validator_change_profile_params(params: Dict[str, Any]) -> ValidatorChangeProfileParams:
     """
     Normalize cValidatorChangeProfile params to flat format.
     Supports both flat format and nested API format.
+    Raises KeyError if unjailed is missing from the flat format,
+    and ValueError if the params or changeProfile are not JSON objects.
     """
+    _expect_object(params, "--json")
     # Check if it's the nested API format
     if "changeProfile" in params:
-        cp = params["changeProfile"]
-        # Extract node_ip from {"Ip": "..."} format if present
-        node_ip = cp.get("node_ip")
-        if isinstance(node_ip, dict) and "Ip" in node_ip:
-            node_ip = node_ip["Ip"]
-        return {
-            "node_ip": node_ip,
-            "name": cp.get("name"),
-            "description": cp.get("description"),
-            "unjailed": cp.get("unjailed", True),
-            "disable_delegations": cp.get("disable_delegations"),
-            "commission_bps": cp.get("commission_bps"),
-            "signer": cp.get("signer"),
-        }
-    # Already flat format, but handle node_ip if it's {"Ip": "..."} format
-    if isinstance(params.get("node_ip"), dict) and "Ip" in params["node_ip"]:
-        params = params.copy()
-        params["node_ip"] = params["node_ip"]["Ip"]
-    return params
-
-
-def confirm_action(action_description: str) -> None:
-    """Print action details and wait for user confirmation before signing."""
-    print()
-    print("=" * 50)
-    print(f"Action: {action_description}")
-    print("=" * 50)
-    print()
+        params = _expect_object(params["changeProfile"], "changeProfile")
+        unjailed = params.get("unjailed", True)
+    else:
+        unjailed = params["unjailed"]
+    return ValidatorChangeProfileParams(
+        node_ip=_unwrap_ip(params.get("node_ip")),
+        name=params.get("name"),
+        description=params.get("description"),
+        unjailed=unjailed,
+        disable_delegations=params.get("disable_delegations"),
+        commission_bps=params.get("commission_bps"),
+        signer=params.get("signer"),
+    )
+
+
+class _CmdSpec(NamedTuple):
+    """How a CLI command maps onto an Exchange method."""
+
+    method: str
+    desc_fmt: str
+    needs_wei: bool = False
+    normalize: Optional[Callable[[Dict[str, Any]], Any]] = None
+    json_example: Optional[Dict[str, Any]] = None
+    # Show the normalized JSON params under the description when confirming
+    show_params: bool = False
+
+    @property
+    def needs_json(self) -> bool:
+        return self.normalize is not None
+
+    def build_kwargs(self, args: Any, json_params: Any) -> Dict[str, Any]:
+        """Build the keyword arguments for the Exchange method."""
+        kwargs = {}
+        if self.needs_wei:
+            kwargs["wei"] = args.wei
+        if self.needs_json:
+            kwargs.update(json_params._asdict())
+        return kwargs
+
+
+COMMANDS = {
+    "cDeposit": _CmdSpec(
+        method="c_deposit",
+        desc_fmt="Deposit {wei} wei into staking",
+        needs_wei=True,
+    ),
+    "cWithdraw": _CmdSpec(
+        method="c_withdraw",
+        desc_fmt="Withdraw {wei} wei from staking",
+        needs_wei=True,
+    ),
+    "cSignerJailSelf": _CmdSpec(
+        method="c_signer_jail_self",
+        desc_fmt="Jail self (validator signer)",
+    ),
+    "cSignerUnjailSelf": _CmdSpec(
+        method="c_signer_unjail_self",
+        desc_fmt="Unjail self (validator signer)",
+    ),
+    "cValidatorRegister": _CmdSpec(
+        method="c_validator_register",
+        desc_fmt="Register validator: {name}",
+        normalize=normalize_validator_register_params,
+        json_example={
+            "node_ip": "1.2.3.4",
+            "name": "Validator Name",
+            "description": "Description",
+            "delegations_disabled": False,
+            "commission_bps": 1000,
+            "signer": "0x...",
+            "unjailed": True,
+            "initial_wei": 100000000,
+        },
+    ),
+    "cValidatorChangeProfile": _CmdSpec(
+        method="c_validator_change_profile",
+        desc_fmt="Change validator profile",
+        normalize=normalize_validator_change_profile_params,
+        json_example={
+            "unjailed": True,
+            "node_ip": "1.2.3.4 (optional)",
+            "name": "null or string (optional)",
+            "description": "null or string (optional)",
+            "disable_delegations": "null or bool (optional)",
+            "commission_bps": "null or int (optional)",
+            "signer": "null or address (optional)",
+        },
+        show_params=True,
+    ),
+    "cValidatorUnregister": _CmdSpec(
+        method="c_validator_unregister",
+        desc_fmt="Unregister validator",
+    ),
+}
+
+
+class _SafeDict(Dict[str, Any]):
+    """format_map mapping that leaves unknown placeholders untouched."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+def confirm_action(action_description: str, details: Optional[str] = None) -> None:
+    """
+    Print action details and wait for user confirmation before signing.
+    The Ledger only displays hashes, so this is the user's readable view of what gets signed.
+    """
+    separator = "=" * 50
+    if details is not None:
+        action_description = f"{action_description}\n{details}"
+    sys.stdout.write(f"\n{separator}\nAction: {action_description}\n{separator}\n\n")
+    sys.stdout.flush()
     input("Press Enter to continue to signing (Ctrl+C to cancel)...")
 
 
-def main():
+def _build_parser() -> Any:
+    """Build the full argparse parser, used for --help and for reporting usage errors."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Hyperliquid CLI for staking and validator operations",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -161,15 +333,7 @@ Examples:
 
     parser.add_argument(
         "command",
-        choices=[
-            "cDeposit",
-            "cWithdraw",
-            "cSignerJailSelf",
-            "cSignerUnjailSelf",
-            "cValidatorRegister",
-            "cValidatorChangeProfile",
-            "cValidatorUnregister",
-        ],
+        choices=list(COMMANDS),
         help="Command to execute",
     )
     parser.add_argument(
@@ -195,136 +359,142 @@ Examples:
         action="store_true",
         help="Use testnet instead of mainnet",
     )
+    return parser
 
-    args = parser.parse_args()
 
-    # Setup Ledger
-    account_path = get_ledger_account_path(args.ledger_account)
-    print(f"Connecting to Ledger device (account path: {account_path})...")
+# Flags that take a value: flag -> (attribute, converter)
+_VALUE_FLAGS = {
+    "--wei": ("wei", int),
+    "--json": ("json", str),
+    "--ledger-account": ("ledger_account", int),
+}
+
+
+def _parse_args_fast(argv: List[str]) -> Optional[SimpleNamespace]:
+    """
+    Parse well-formed arguments without building an argparse parser.
+    Returns None for --help or anything unexpected, so argparse can handle it.
+    """
+    args = SimpleNamespace(command=None, wei=None, json=None, ledger_account=None, testnet=False)
+    i = 0
+    while i < len(argv):
+        arg = argv[i]
+        i += 1
+        if arg == "--testnet":
+            args.testnet = True
+            continue
+        flag, has_value, value = arg.partition("=")
+        if flag in _VALUE_FLAGS:
+            if not has_value:
+                # Leave values that look like options to argparse's own rules
+                if i == len(argv) or argv[i].startswith("-"):
+                    return None
+                value = argv[i]
+                i += 1
+            dest, convert = _VALUE_FLAGS[flag]
+            try:
+                setattr(args, dest, convert(value))
+            except ValueError:
+                return None
+        elif arg.startswith("-") or args.command is not None or arg not in COMMANDS:
+            return None
+        else:
+            args.command = arg
+    if args.command is None or args.ledger_account is None:
+        return None
+    return args
+
+
+def parse_args(argv: List[str]) -> Any:
+    """Parse CLI arguments, falling back to argparse for help output and usage errors."""
+    args = _parse_args_fast(argv)
+    if args is None:
+        args = _build_parser().parse_args(argv)
+    return args
 
-    try:
-        wallet = LedgerSigner(account_path=account_path)
-    except Exception as e:
-        print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
 
-    # Setup Exchange
-    network = "TESTNET" if args.testnet else "MAINNET"
-    base_url = TESTNET_API_URL if args.testnet else MAINNET_API_URL
-    print(f"Network: {network}")
-    exchange = Exchange(wallet, base_url)
+def main():
+    args = parse_args(sys.argv[1:])
+    spec = COMMANDS[args.command]
 
     # Validate arguments based on command
-    if args.command in ["cDeposit", "cWithdraw"] and args.wei is None:
+    if spec.needs_wei and args.wei is None:
         print(f"Error: --wei is required for {args.command}", file=sys.stderr)
         sys.exit(1)
 
-    if args.command in ["cValidatorRegister", "cValidatorChangeProfile"] and args.json is None:
+    if spec.needs_json and not args.json:
         print(f"Error: --json is required for {args.command}", file=sys.stderr)
         sys.exit(1)
 
-    # Parse JSON if provided
+    # Parse and validate JSON before touching the Ledger, so input errors return immediately
     json_params = None
     if args.json:
         try:
-            json_params = json.loads(args.json)
+            json_params = _loads(args.json)
         except json.JSONDecodeError as e:
             print(f"Error: Invalid JSON: {e}", file=sys.stderr)
             sys.exit(1)
 
         # Normalize JSON params based on command
-        if args.command == "cValidatorRegister":
-            json_params = normalize_validator_register_params(json_params)
-        elif args.command == "cValidatorChangeProfile":
-            json_params = normalize_validator_change_profile_params(json_params)
-
-    # Build action description and confirm before signing
-    if args.command == "cDeposit":
-        action_desc = f"Deposit {args.wei} wei into staking"
-    elif args.command == "cWithdraw":
-        action_desc = f"Withdraw {args.wei} wei from staking"
-    elif args.command == "cSignerJailSelf":
-        action_desc = "Jail self (validator signer)"
-    elif args.command == "cSignerUnjailSelf":
-        action_desc = "Unjail self (validator signer)"
-    elif args.command == "cValidatorRegister":
-        action_desc = f"Register validator: {json_params.get('name', 'unnamed')}"
-    elif args.command == "cValidatorChangeProfile":
-        action_desc = f"Change validator profile\n{json.dumps(json_params, indent=2)}"
-    elif args.command == "cValidatorUnregister":
-        action_desc = "Unregister validator"
+        if spec.normalize is not None:
+            try:
+                json_params = spec.normalize(json_params)
+            except (KeyError, ValueError) as e:
+                if isinstance(e, KeyError):
+                    print(f"Error: Missing required JSON field: {e}", file=sys.stderr)
+                else:
+                    print(f"Error: {e}", file=sys.stderr)
+                if spec.json_example is not None:
+                    print(f"\nExpected JSON format for {args.command}:", file=sys.stderr)
+                    print(_dumps(spec.json_example), file=sys.stderr)
+                sys.exit(1)
+
+    # Build action description
+    desc_values = _SafeDict(wei=args.wei)
+    if spec.needs_json:
+        desc_values["name"] = json_params.name or "unnamed"
+    action_desc = spec.desc_fmt.format_map(desc_values)
+    details = _dumps(json_params._asdict()) if spec.show_params else None
+
+    # Deferred so that --help and input errors don't pay for the signing stack
+    from hyperliquid.exchange import Exchange
+    from hyperliquid.utils.ledger_signer import LedgerSigner
 
-    try:
-        confirm_action(action_desc)
-    except KeyboardInterrupt:
-        print("\nCancelled.")
-        sys.exit(0)
+    # Setup Ledger
+    account_path = get_ledger_account_path(args.ledger_account)
+    print(f"Connecting to Ledger device (account path: {account_path})...")
 
-    # Execute command
     try:
-        if args.command == "cDeposit":
-            result = exchange.c_deposit(wei=args.wei)
-        elif args.command == "cWithdraw":
-            result = exchange.c_withdraw(wei=args.wei)
-        elif args.command == "cSignerJailSelf":
-            result = exchange.c_signer_jail_self()
-        elif args.command == "cSignerUnjailSelf":
-            result = exchange.c_signer_unjail_self()
-        elif args.command == "cValidatorRegister":
-            result = exchange.c_validator_register(
-                node_ip=json_params["node_ip"],
-                name=json_params["name"],
-                description=json_params["description"],
-                delegations_disabled=json_params["delegations_disabled"],
-                commission_bps=json_params["commission_bps"],
-                signer=json_params["signer"],
-                unjailed=json_params["unjailed"],
-                initial_wei=json_params["initial_wei"],
-            )
-        elif args.command == "cValidatorChangeProfile":
-            result = exchange.c_validator_change_profile(
-                node_ip=json_params.get("node_ip"),
-                name=json_params.get("name"),
-                description=json_params.get("description"),
-                unjailed=json_params["unjailed"],
-                disable_delegations=json_params.get("disable_delegations"),
-                commission_bps=json_params.get("commission_bps"),
-                signer=json_params.get("signer"),
-            )
-        elif args.command == "cValidatorUnregister":
-            result = exchange.c_validator_unregister()
-
-        print(json.dumps(result, indent=2))
-    except KeyError as e:
-        print(f"Error: Missing required JSON field: {e}", file=sys.stderr)
-        if args.command == "cValidatorRegister":
-            print("\nExpected JSON format for cValidatorRegister:", file=sys.stderr)
-            print(json.dumps({
-                "node_ip": "1.2.3.4",
-                "name": "Validator Name",
-                "description": "Description",
-                "delegations_disabled": False,
-                "commission_bps": 1000,
-                "signer": "0x...",
-                "unjailed": True,
-                "initial_wei": 100000000,
-            }, indent=2), file=sys.stderr)
-        elif args.command == "cValidatorChangeProfile":
-            print("\nExpected JSON format for cValidatorChangeProfile:", file=sys.stderr)
-            print(json.dumps({
-                "unjailed": True,
-                "node_ip": "1.2.3.4 (optional)",
-                "name": "null or string (optional)",
-                "description": "null or string (optional)",
-                "disable_delegations": "null or bool (optional)",
-                "commission_bps": "null or int (optional)",
-                "signer": "null or address (optional)",
-            }, indent=2), file=sys.stderr)
-        sys.exit(1)
+        wallet = LedgerSigner(account_path=account_path)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
 
+    # Release the Ledger on every exit path, including sys.exit and Ctrl+C
+    try:
+        # Setup Exchange
+        network = "TESTNET" if args.testnet else "MAINNET"
+        base_url = _base_url(args.testnet)
+        print(f"Network: {network}")
+        exchange = Exchange(wallet, base_url)
+
+        # Confirm before signing
+        try:
+            confirm_action(action_desc, details)
+        except KeyboardInterrupt:
+            print("\nCancelled.")
+            sys.exit(0)
+
+        # Execute command
+        try:
+            result = getattr(exchange, spec.method)(**spec.build_kwargs(args, json_params))
+            _print_json(result)
+        except Exception as e:
+            print(f"Error: {e}", file=sys.stderr)
+            sys.exit(1)
+    finally:
+        wallet.close()
+
 
 if __name__ == "__main__":
     main()
@@ -1028,10 +1028,9 @@ class Exchange(API):
         unjailed: bool,
         initial_wei: int,
     ) -> Any:
-        timestamp = get_timestamp_ms()
-        action = {
-            "type": "CValidatorAction",
-            "register": {
+        return self.c_validator_inner(
+            "register",
+            {
                 "profile": {
                     "node_ip": {"Ip": node_ip},
                     "name": name,
@@ -1043,19 +1042,32 @@ class Exchange(API):
                 "unjailed": unjailed,
                 "initial_wei": initial_wei,
             },
-        }
-        signature = sign_l1_action(
-            self.wallet,
-            action,
-            None,
-            timestamp,
-            self.expires_after,
-            self.base_url == MAINNET_API_URL,
         )
-        return self._post_action(
-            action,
-            signature,
-            timestamp,
+
+    def c_validator_register_raw(self, register: Dict[str, Any]) -> Any:
+        """Register a validator from a payload already in the API's register format.
+
+        Args:
+            register (Dict[str, Any]): {"profile": {"node_ip": {"Ip": str}, "name": str, "description": str,
+                "delegations_disabled": bool, "commission_bps": int, "signer": str}, "unjailed": bool,
+                "initial_wei": int}. Keys may be in any order.
+        """
+        profile = register["profile"]
+        # The action hash depends on key order, so rebuild the payload in the order the server expects
+        return self.c_validator_inner(
+            "register",
+            {
+                "profile": {
+                    "node_ip": profile["node_ip"],
+                    "name": profile["name"],
+                    "description": profile["description"],
+                    "delegations_disabled": profile["delegations_disabled"],
+                    "commission_bps": profile["commission_bps"],
+                    "signer": profile["signer"].lower(),
+                },
+                "unjailed": register["unjailed"],
+                "initial_wei": register["initial_wei"],
+            },
         )
 
     def c_validator_change_profile(
@@ -1068,10 +1080,9 @@ class Exchange(API):
         commission_bps: Optional[int],
         signer: Optional[str],
     ) -> Any:
-        timestamp = get_timestamp_ms()
-        action = {
-            "type": "CValidatorAction",
-            "changeProfile": {
+        return self.c_validator_inner(
+            "changeProfile",
+            {
                 "node_ip": None if node_ip is None else {"Ip": node_ip},
                 "name": name,
                 "description": description,
@@ -1080,26 +1091,16 @@ class Exchange(API):
                 "commission_bps": commission_bps,
                 "signer": None if signer is None else signer.lower(),
             },
-        }
-        signature = sign_l1_action(
-            self.wallet,
-            action,
-            None,
-            timestamp,
-            self.expires_after,
-            self.base_url == MAINNET_API_URL,
-        )
-        return self._post_action(
-            action,
-            signature,
-            timestamp,
         )
 
     def c_validator_unregister(self) -> Any:
+        return self.c_validator_inner("unregister", None)
+
+    def c_validator_inner(self, variant: str, payload: Any) -> Any:
         timestamp = get_timestamp_ms()
         action = {
             "type": "CValidatorAction",
-            "unregister": None,
+            variant: payload,
         }
         signature = sign_l1_action(
             self.wallet,
@@ -577,12 +577,14 @@ class Info(API):
         """
         return self.post("/info", {"type": "delegations", "user": address})
 
-    def user_staking_rewards(self, address: str) -> Any:
-        """Retrieve the historic staking rewards associated with a user.
+    def user_staking_rewards(self, address: str, limit: Optional[int] = None) -> Any:
+        """Retrieve the historic staking rewards associated with a user, most recent first.
         POST /info
         Args:
             address (str): Onchain address in 42-character hexadecimal format;
                             e.g. 0x0000000000000000000000000000000000000000.
+            limit (Optional[int]): Only return this many of the most recent rewards. The endpoint has no
+                            server-side limit, so the full history is still fetched.
         Returns:
             [
                 {
@@ -592,7 +594,10 @@ class Info(API):
                 },
             ]
         """
-        return self.post("/info", {"type": "delegatorRewards", "user": address})
+        rewards = self.post("/info", {"type": "delegatorRewards", "user": address})
+        if limit is not None and isinstance(rewards, list):
+            return rewards[:limit]
+        return rewards
 
     def delegator_history(self, user: str) -> Any:
         """Retrieve comprehensive staking history for a user.
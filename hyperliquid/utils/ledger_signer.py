@@ -1,8 +1,31 @@
+from typing import Any, Dict, Optional, Tuple
+
+from eth_account._utils.encode_typed_data.encoding_and_hashing import hash_domain, hash_struct
+from ledgerblue.comm import getDongle
+from ledgerblue.commException import CommException
+from ledgerblue.Dongle import Dongle
 from ledgereth.accounts import get_account_by_path
+from ledgereth.comms import dongle_send, dongle_send_data, is_usable_version
+from ledgereth.exceptions import LedgerError
 from ledgereth.objects import LedgerAccount
-from ledgereth.messages import sign_typed_data_draft
-from eth_account.messages import encode_typed_data
-from eth_utils import to_hex
+from ledgereth.utils import is_bip32_path, parse_bip32_path
+
+
+def _open_dongle() -> Dongle:
+    """Open the Ledger transport and run the same firmware check as ledgereth's init_dongle."""
+    try:
+        dongle = getDongle(debug=False)
+    except CommException as err:
+        raise LedgerError.transalate_comm_exception(err) from err
+    try:
+        config = dongle_send(dongle, "GET_CONFIGURATION")
+        if not config or not is_usable_version(config):
+            raise LedgerError("Unsupported Ethereum app version")
+    except Exception:
+        # The caller never sees this handle, so it has to be released here
+        dongle.close()
+        raise
+    return dongle
 
 
 class LedgerSigner:
@@ -18,12 +41,28 @@ class LedgerSigner:
         Args:
             account_path: BIP44 derivation path (default is first Ethereum account)
         """
+        if not is_bip32_path(account_path):
+            raise ValueError(f"Invalid BIP32 path: {account_path}")
         self._account_path = account_path
-        # Get account from the Ledger device using the specified derivation path
+        # SIGN_TYPED_DATA expects the path as a level count followed by the packed levels.
+        # It never changes for this signer, so encode it once rather than on every signature.
+        path = parse_bip32_path(account_path)
+        self._packed_path = (len(path) // 4).to_bytes(1, "big") + path
+        # The EIP-712 domain is fixed for a given action family and network, so hash it once
+        self._domain_hash_cache: Dict[Tuple[Any, ...], bytes] = {}
+        # Open the transport explicitly so every APDU below goes over the same channel.
+        # ledgerblue picks the transport (USB HID, or BLE when LEDGER_BLE_PROXY is set);
+        # HID always uses full 64-byte reports and BLE negotiates its MTU on connect.
+        self._dongle: Optional[Dongle] = None
         try:
-            self._account: LedgerAccount = get_account_by_path(account_path)
-            print(f"Ledger address: {self._account.address}")
+            self._dongle = _open_dongle()
+            # Get account from the Ledger device using the specified derivation path
+            self._account: LedgerAccount = get_account_by_path(account_path, dongle=self._dongle)
+            self._address: str = self._account.address
+            print(f"Ledger address: {self._address}")
         except Exception as e:
+            # Don't leave the device claimed until GC; a retry in this process would fail to open it
+            self.close()
             raise RuntimeError(
                 f"Failed to connect to Ledger device: {e}\n"
                 "Make sure your Ledger is: "
@@ -33,9 +72,19 @@ class LedgerSigner:
     @property
     def address(self) -> str:
         """Return the Ethereum address from the Ledger."""
-        return self._account.address
+        return self._address
 
-    def sign_typed_data(self, typed_data: dict) -> dict:
+    def close(self) -> None:
+        """Release the connection to the Ledger device."""
+        dongle = getattr(self, "_dongle", None)
+        if dongle is not None:
+            dongle.close()
+            self._dongle = None
+
+    def __del__(self):
+        self.close()
+
+    def sign_typed_data(self, typed_data: Dict[str, Any]) -> Dict[str, Any]:
         """
         Sign EIP-712 typed data directly with the Ledger.
 
@@ -45,23 +94,34 @@ class LedgerSigner:
         Returns:
             Dict with r, s, v signature components
         """
-        # Use full_message form to preserve primaryType (important for L1 actions)
-        # This ensures the encoding matches what the verifier expects
-        signable = encode_typed_data(full_message=typed_data)
+        domain = typed_data["domain"]
+        key = (domain["name"], domain["version"], domain["chainId"], domain["verifyingContract"])
+        domain_hash = self._domain_hash_cache.get(key)
+        if domain_hash is None:
+            domain_hash = hash_domain(domain)
+            self._domain_hash_cache[key] = domain_hash
 
         # Pass raw bytes - ledgereth expects 32-byte hashes, not hex strings
-        domain_hash = bytes(signable.header)
-        message_hash = bytes(signable.body)
-
-        # Sign with Ledger using the pre-computed hashes
-        signed = sign_typed_data_draft(
-            domain_hash=domain_hash,
-            message_hash=message_hash,
-            sender_path=self._account_path,
+        signing_types = {k: v for k, v in typed_data["types"].items() if k != "EIP712Domain"}
+        message_hash = hash_struct(typed_data["primaryType"], signing_types, typed_data["message"])
+
+        # Sign with Ledger using the pre-computed hashes, reusing the open transport.
+        # This is the APDU ledgereth's sign_typed_data_draft sends, minus re-parsing the path.
+        if self._dongle is None:
+            raise RuntimeError("Ledger connection has been closed")
+        payload = self._packed_path + domain_hash + message_hash
+        retval = dongle_send_data(
+            self._dongle,
+            "SIGN_TYPED_DATA",
+            payload,
+            Lc=len(payload).to_bytes(1, "big"),
         )
+        if retval is None or len(retval) < 65:
+            raise RuntimeError("Invalid response from Ledger")
 
+        # r and s are ints, for which eth_utils.to_hex is plain hex(); skip its type dispatch
         return {
-            "r": to_hex(signed.r),
-            "s": to_hex(signed.s),
-            "v": signed.v,
-        }
\ No newline at end of file
+            "r": hex(int.from_bytes(retval[1:33], "big")),
+            "s": hex(int.from_bytes(retval[33:65], "big")),
+            "v": retval[0],
+        }
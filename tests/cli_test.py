@@ -0,0 +1,83 @@
+import sys
+
+import pytest
+
+from hyperliquid.cli import (
+    _build_parser,
+    _parse_args_fast,
+    main,
+    normalize_validator_change_profile_params,
+    normalize_validator_register_params,
+)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["cDeposit", "--wei", "100000000", "--ledger-account", "0"],
+        ["cWithdraw", "--wei=50000000", "--ledger-account=11", "--testnet"],
+        ["--ledger-account", "0", "cSignerJailSelf"],
+        ["cSignerUnjailSelf", "--ledger-account", "0", "--ledger-account", "3"],
+        ["cValidatorRegister", "--ledger-account", "0", "--json", '{"node_ip": "1.2.3.4"}'],
+        ["cValidatorChangeProfile", "--json={}", "--ledger-account", "0", "--testnet"],
+    ],
+)
+def test_fast_parse_matches_argparse(argv):
+    assert vars(_parse_args_fast(argv)) == vars(_build_parser().parse_args(argv))
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["-h"],
+        ["cDeposit", "--help"],
+        ["cDeposit", "--wei", "1", "--ledger", "0"],
+        ["cDeposit", "--wei", "-5", "--ledger-account", "0"],
+        ["cDeposit", "--ledger-account", "0", "--", "--wei"],
+        ["cUnknown", "--ledger-account", "0"],
+        ["cDeposit", "--wei", "abc", "--ledger-account", "0"],
+        ["cDeposit", "--wei", "1"],
+        ["cDeposit", "--ledger-account"],
+    ],
+)
+def test_fast_parse_defers_to_argparse(argv):
+    assert _parse_args_fast(argv) is None
+
+
+def test_normalizers_reject_missing_fields():
+    with pytest.raises(KeyError):
+        normalize_validator_register_params({"node_ip": "1.2.3.4", "name": "Validator"})
+    with pytest.raises(KeyError):
+        normalize_validator_change_profile_params({"name": "Validator"})
+
+
+@pytest.mark.parametrize(
+    "command, json_arg",
+    [
+        ("cValidatorRegister", "[]"),
+        ("cValidatorRegister", "5"),
+        ("cValidatorRegister", '"x"'),
+        ("cValidatorRegister", '{"register": 1}'),
+        ("cValidatorRegister", '{"register": {"profile": []}}'),
+        ("cValidatorChangeProfile", "[]"),
+        ("cValidatorChangeProfile", '{"changeProfile": null}'),
+    ],
+)
+def test_non_object_json_is_rejected_before_ledger(monkeypatch, capsys, command, json_arg):
+    monkeypatch.setattr(sys, "argv", ["hyperliquid", command, "--ledger-account", "0", "--json", json_arg])
+    with pytest.raises(SystemExit) as exc_info:
+        main()
+    assert exc_info.value.code == 1
+    assert f"Expected JSON format for {command}:" in capsys.readouterr().err
+
+
+def test_normalizers_accept_nested_api_format():
+    register = normalize_validator_register_params(
+        {"register": {"profile": {"node_ip": {"Ip": "1.2.3.4"}, "name": "Validator"}, "initial_wei": 1}}
+    )
+    assert register.node_ip == "1.2.3.4"
+    assert register.commission_bps == 0
+    assert register.unjailed is True
+    change_profile = normalize_validator_change_profile_params({"changeProfile": {"node_ip": {"Ip": "1.2.3.4"}}})
+    assert change_profile.node_ip == "1.2.3.4"
+    assert change_profile.unjailed is True
@@ -0,0 +1,38 @@
+import eth_account
+
+import hyperliquid.exchange as exchange_module
+from hyperliquid.exchange import Exchange
+
+
+def test_c_validator_register_raw_matches_c_validator_register(monkeypatch):
+    posted = []
+    wallet = eth_account.Account.from_key("0x0123456789012345678901234567890123456789012345678901234567890123")
+    monkeypatch.setattr(exchange_module, "get_timestamp_ms", lambda: 1700000000000)
+    # Return what would be signed as the "signature" so both calls can be compared
+    monkeypatch.setattr(exchange_module, "sign_l1_action", lambda *args: args[1:])
+    # Exchange builds an Info, which would otherwise fetch meta over the network
+    monkeypatch.setattr(exchange_module.Info, "__init__", lambda *args, **kwargs: None)
+    exchange = Exchange(wallet)
+    monkeypatch.setattr(exchange, "_post_action", lambda action, signature, nonce: posted.append(signature))
+
+    exchange.c_validator_register("1.2.3.4", "Validator", "Description", False, 1000, "0xABCDEF", True, 100000000)
+    # Keys deliberately out of the canonical order
+    exchange.c_validator_register_raw(
+        {
+            "initial_wei": 100000000,
+            "unjailed": True,
+            "profile": {
+                "signer": "0xABCDEF",
+                "commission_bps": 1000,
+                "delegations_disabled": False,
+                "description": "Description",
+                "name": "Validator",
+                "node_ip": {"Ip": "1.2.3.4"},
+            },
+        }
+    )
+    # sign_l1_action saw the same action, including key order and the lowercased signer
+    assert list(posted[0][0]["register"]) == list(posted[1][0]["register"])
+    assert list(posted[0][0]["register"]["profile"].items()) == list(posted[1][0]["register"]["profile"].items())
+    assert posted[0] == posted[1]
+    assert posted[0][0]["register"]["profile"]["signer"] == "0xabcdef"
@@ -257,3 +257,21 @@ def test_extra_agents():
         assert "name" in agent, "Each agent should have a 'name' field"
         assert "address" in agent, "Each agent should have an 'address' field"
         assert "validUntil" in agent, "Each agent should have a 'validUntil' field"
+
+
+def test_user_staking_rewards(monkeypatch):
+    rewards = [{"time": 1736726400000 - i * 86400000, "source": "delegation", "totalAmount": "0.1"} for i in range(8)]
+    requests = []
+
+    def fake_post(self, url_path, payload=None):
+        requests.append((url_path, payload))
+        return rewards
+
+    monkeypatch.setattr(Info, "post", fake_post)
+    info = Info(skip_ws=True, meta=TEST_META, spot_meta=TEST_SPOT_META)
+    assert info.user_staking_rewards("0x2ba553d9f990a3b66b03b2dc0d030dfc1c061036") == rewards
+    assert info.user_staking_rewards("0x2ba553d9f990a3b66b03b2dc0d030dfc1c061036", limit=5) == rewards[:5]
+    # The limit is applied client-side; the request is the same either way
+    assert (
+        requests == [("/info", {"type": "delegatorRewards", "user": "0x2ba553d9f990a3b66b03b2dc0d030dfc1c061036"})] * 2
+    )
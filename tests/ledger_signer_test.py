@@ -0,0 +1,119 @@
+from unittest import mock
+
+import pytest
+from eth_account.messages import encode_typed_data
+from ledgereth.exceptions import LedgerError
+
+import hyperliquid.utils.ledger_signer as ledger_signer
+from hyperliquid.utils.signing import (
+    C_DEPOSIT_SIGN_TYPES,
+    USD_SEND_SIGN_TYPES,
+    add_multi_sig_fields,
+    add_multi_sig_types,
+    construct_phantom_agent,
+    l1_payload,
+    user_signed_payload,
+)
+
+# 44'/60'/0'/0/0 as sent to the device: level count, then each level with the hardened bit where marked
+EXPECTED_PATH = bytes.fromhex("05" "8000002c" "8000003c" "80000000" "00000000" "00000000")
+
+
+@pytest.fixture
+def sent_payloads(monkeypatch):
+    sent = []
+
+    def fake_dongle_send_data(dongle, command, payload, Lc=None):
+        assert command == "SIGN_TYPED_DATA"
+        sent.append(payload)
+        return bytes([27]) + (1).to_bytes(32, "big") + (2).to_bytes(32, "big")
+
+    monkeypatch.setattr(ledger_signer, "dongle_send_data", fake_dongle_send_data)
+    return sent
+
+
+@pytest.fixture
+def signer(monkeypatch):
+    account = mock.Mock(address="0x0000000000000000000000000000000000000001")
+    monkeypatch.setattr(ledger_signer, "getDongle", lambda debug=False: mock.Mock())
+    # app-ethereum 1.9.0
+    monkeypatch.setattr(ledger_signer, "dongle_send", lambda dongle, command: b"\x00\x01\x09\x00")
+    monkeypatch.setattr(ledger_signer, "get_account_by_path", lambda path, dongle=None: account)
+    return ledger_signer.LedgerSigner()
+
+
+def test_sign_typed_data_hashes_match_encode_typed_data(signer, sent_payloads):
+    c_deposit = {
+        "type": "cDeposit",
+        "wei": 100000000,
+        "nonce": 1700000000000,
+        "signatureChainId": "0x66eee",
+        "hyperliquidChain": "Mainnet",
+    }
+    payloads = [
+        l1_payload(construct_phantom_agent(b"\x01" * 32, True)),
+        user_signed_payload("HyperliquidTransaction:CDeposit", C_DEPOSIT_SIGN_TYPES, c_deposit),
+        l1_payload(construct_phantom_agent(b"\x02" * 32, False)),
+        user_signed_payload("HyperliquidTransaction:CDeposit", C_DEPOSIT_SIGN_TYPES, {**c_deposit, "wei": 1}),
+    ]
+    # Later payloads reuse the cached domain hash with different messages
+    for data in payloads:
+        assert signer.sign_typed_data(data) == {"r": "0x1", "s": "0x2", "v": 27}
+        expected = encode_typed_data(full_message=data)
+        assert sent_payloads[-1] == EXPECTED_PATH + bytes(expected.header) + bytes(expected.body)
+
+
+def test_multi_sig_schema_is_not_hashed_with_plain_schema(signer, sent_payloads):
+    usd_send = {
+        "type": "usdSend",
+        "destination": "0x5e9ee1089755c3435139848e47e6635505d5a13a",
+        "amount": "1",
+        "time": 1687816341423,
+        "signatureChainId": "0x66eee",
+        "hyperliquidChain": "Mainnet",
+    }
+    multi_sig_usd_send = add_multi_sig_fields(
+        usd_send,
+        "0x0000000000000000000000000000000000000005",
+        "0x0000000000000000000000000000000000000006",
+    )
+    # Both share primaryType; the multi-sig one has two extra fields
+    payloads = [
+        user_signed_payload("HyperliquidTransaction:UsdSend", USD_SEND_SIGN_TYPES, usd_send),
+        user_signed_payload(
+            "HyperliquidTransaction:UsdSend", add_multi_sig_types(USD_SEND_SIGN_TYPES), multi_sig_usd_send
+        ),
+    ]
+    for data in payloads:
+        signer.sign_typed_data(data)
+        expected = encode_typed_data(full_message=data)
+        assert sent_payloads[-1] == EXPECTED_PATH + bytes(expected.header) + bytes(expected.body)
+
+
+def test_unsupported_app_version_is_rejected(monkeypatch):
+    dongle = mock.Mock()
+    monkeypatch.setattr(ledger_signer, "getDongle", lambda debug=False: dongle)
+    # app-ethereum 1.1.0 predates EIP-712 support
+    monkeypatch.setattr(ledger_signer, "dongle_send", lambda dongle, command: b"\x00\x01\x01\x00")
+    with pytest.raises(RuntimeError, match="Unsupported Ethereum app version"):
+        ledger_signer.LedgerSigner()
+    dongle.close.assert_called_once()
+
+
+def test_dongle_is_closed_when_configuration_check_fails(monkeypatch):
+    dongle = mock.Mock()
+    monkeypatch.setattr(ledger_signer, "getDongle", lambda debug=False: dongle)
+    monkeypatch.setattr(ledger_signer, "dongle_send", mock.Mock(side_effect=LedgerError("Ethereum app is not open")))
+    with pytest.raises(RuntimeError, match="Ethereum app is not open"):
+        ledger_signer.LedgerSigner()
+    dongle.close.assert_called_once()
+
+
+def test_dongle_is_closed_when_account_lookup_fails(monkeypatch):
+    dongle = mock.Mock()
+    monkeypatch.setattr(ledger_signer, "getDongle", lambda debug=False: dongle)
+    monkeypatch.setattr(ledger_signer, "dongle_send", lambda dongle, command: b"\x00\x01\x09\x00")
+    monkeypatch.setattr(ledger_signer, "get_account_by_path", mock.Mock(side_effect=Exception("locked")))
+    with pytest.raises(RuntimeError, match="locked"):
+        ledger_signer.LedgerSigner()
+    dongle.close.assert_called_once()